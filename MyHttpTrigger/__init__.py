@@ -1,143 +1,247 @@
 # MyHttpTrigger/__init__.py
 import logging
-import json
+import contextvars
 import azure.functions as func
-from azure.identity import DefaultAzureCredential, CredentialUnavailableError
+import functools
+import itertools
 import os
+import secrets
 import sys
+import threading
+
+# orjson serializa directamente a bytes UTF-8 y parsea bytes sin pasar por str.
+# Si no está instalado se usa un shim sobre json con la misma interfaz (dumps -> bytes).
+try:
+    import orjson
+except ImportError:
+    import json
+
+    class orjson:  # type: ignore[no-redef]
+        JSONDecodeError = json.JSONDecodeError
+        OPT_NON_STR_KEYS = 0
+
+        @staticmethod
+        def dumps(obj, option: int = 0) -> bytes:
+            return json.dumps(obj, default=str).encode("utf-8")
+
+        @staticmethod
+        def loads(data):
+            return json.loads(data)
 
 # --- INICIO DEL AJUSTE DE SYS.PATH ---
 # Añade la raíz del proyecto (/home/site/wwwroot en Azure) a sys.path
-# Esto permite importaciones absolutas de módulos como 'shared', 'actions', 'mapping_actions', 'ejecutor'.
+# Esto permite importaciones absolutas de módulos como 'shared', 'actions', 'mapping_actions'.
+# Se añade al final: cada import de terceros (azure.*, requests...) recorre sys.path en orden,
+# y con la raíz delante cada uno fallaría primero contra el sistema de archivos de wwwroot.
 PARENT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if PARENT_DIR not in sys.path:
-    sys.path.insert(0, PARENT_DIR)
+    sys.path.append(PARENT_DIR)
 # --- FIN DEL AJUSTE DE SYS.PATH ---
 
-# Ahora se pueden importar los módulos de la raíz del proyecto
-# (ejecutor.py, mapping_actions.py, shared/, actions/)
-import ejecutor # ejecutor.py está en la raíz
-import mapping_actions # mapping_actions.py está en la raíz
-from shared import constants
-from shared.helpers.http_client import AuthenticatedHttpClient
-
 logger = logging.getLogger("MyHttpTrigger_Function")
 
+# Prefijo [InvocationId/RequestId] de la petición en curso. Lo añade un filtro del logger
+# solo a los registros que realmente se emiten, en lugar de interpolarlo en cada llamada.
+_LOG_PREFIX: contextvars.ContextVar[str] = contextvars.ContextVar("log_prefix", default="[No RequestId]")
+
+
+class _RequestPrefixFilter(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool:
+        prefix = _LOG_PREFIX.get()
+        if record.args:
+            prefix = prefix.replace("%", "%%")
+        record.msg = f"{prefix} {record.msg}"
+        return True
+
+
+logger.addFilter(_RequestPrefixFilter())
+
+# Variables de entorno: no cambian durante la vida del worker, se leen una sola vez.
+_INVOCATION_ID = os.environ.get("InvocationID")
+
+# Etiqueta aleatoria del worker (una sola vez) + contador local del proceso para generar
+# RequestId cuando no llega X-Request-ID. El PID no sirve como etiqueta: en contenedores
+# distintos suele repetirse (p.ej. siempre el mismo), y los IDs colisionarían entre instancias.
+_WORKER_TAG = secrets.token_hex(4)
+_REQ_COUNTER = itertools.count()
+
+# Opciones para serializar resultados de acciones: json.dumps aceptaba claves no-str
+# (p.ej. int) y orjson las rechaza por defecto. datetime/UUID los serializa orjson de forma nativa.
+_RESULT_DUMPS_OPTION = orjson.OPT_NON_STR_KEYS
+
+# --- Cuerpos de error constantes (serializados una sola vez) ---
+_ERR_METHOD_NOT_ALLOWED = orjson.dumps({"error": "MethodNotAllowed", "message": "Solo se permite el método POST."})
+_ERR_INVALID_JSON = orjson.dumps({"error": "InvalidJSON", "message": "El cuerpo de la solicitud no es un JSON válido."})
+_ERR_BODY_NOT_OBJECT = orjson.dumps({"error": "InvalidJSON", "message": "El cuerpo de la solicitud debe ser un objeto JSON."})
+_ERR_MISSING_ACTION = orjson.dumps({"error": "MissingAction", "message": "El campo 'action' es requerido en el cuerpo JSON."})
+_ERR_PARAMS_NOT_OBJECT = orjson.dumps({"error": "BadRequest", "message": "El campo 'params' debe ser un objeto JSON."})
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _json_response(body: bytes, status_code: int) -> func.HttpResponse:
+    # El cuerpo ya llega serializado (bytes); la cabecera explícita evita que el worker
+    # derive el Content-Type a partir de mimetype/charset en cada respuesta.
+    return func.HttpResponse(body, status_code=status_code, headers=_JSON_HEADERS)
+
+
+# --- Carga diferida ---
+# mapping_actions solo declara las acciones (cada módulo de 'actions/' se importa en la
+# primera petición que usa una de sus acciones) y el cliente HTTP arrastra 'requests' y
+# 'azure.identity'; nada de eso se importa en el camino de la petición, así las peticiones
+# rechazadas (método, JSON inválido) no pagan ese coste (ver _warmup para el arranque).
+@functools.lru_cache(maxsize=None)
+def _get_action_map():
+    import mapping_actions # mapping_actions.py está en la raíz
+    return mapping_actions.ACTION_MAP
+
+
+@functools.lru_cache(maxsize=None)
+def _get_jpeg_actions() -> frozenset:
+    # Acciones cuyo resultado binario es una imagen JPEG (fotos de perfil).
+    # Iterar ACTION_MAP solo recorre los nombres: no importa ningún módulo de acciones.
+    return frozenset(
+        name for name in _get_action_map()
+        if "photo" in name.lower() or name.endswith("_get_my_photo")
+    )
+
+
+# Credencial y cliente compartidos por todas las invocaciones del worker.
+# DefaultAzureCredential recuerda qué credencial de la cadena funcionó y cachea los
+# tokens internamente; recrearla en cada petición descartaba esa caché.
+# Los errores de identidad se reportan en la primera llamada real a la API.
+_HTTP_CLIENT = None
+_HTTP_CLIENT_LOCK = threading.Lock()
+
+
+def _get_http_client():
+    # Las funciones síncronas se ejecutan en un pool de hilos: el lock evita que varias
+    # peticiones simultáneas en un worker recién arrancado creen credenciales distintas.
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        with _HTTP_CLIENT_LOCK:
+            if _HTTP_CLIENT is None:
+                from azure.identity import DefaultAzureCredential
+                from shared.helpers.http_client import AuthenticatedHttpClient
+                # Solo acelera el desarrollo local: en Azure, Managed Identity va antes en la cadena
+                # y DefaultAzureCredential recuerda la credencial que funcionó, así que las excluidas
+                # nunca se prueban en el host. En local (az login) se evita sondear SharedTokenCache
+                # y VS Code antes de llegar a Azure CLI, que sigue habilitada.
+                credential = DefaultAzureCredential(
+                    exclude_shared_token_cache_credential=True,
+                    exclude_visual_studio_code_credential=True,
+                    exclude_developer_cli_credential=True,
+                    exclude_powershell_credential=True,
+                    exclude_interactive_browser_credential=True,
+                )
+                _HTTP_CLIENT = AuthenticatedHttpClient(credential)
+    return _HTTP_CLIENT
+
+
+def _warmup() -> None:
+    # Se ejecuta en segundo plano al cargar el módulo, en paralelo con el resto del arranque
+    # del worker: importa azure.identity/requests, crea el cliente compartido y deja en cache
+    # el token de Graph. Si la primera petición llega antes, hace ese trabajo ella misma
+    # (el lock de _get_http_client evita duplicarlo); un fallo aquí solo se registra.
+    try:
+        _get_action_map()
+        from shared import constants
+        _get_http_client().prefetch_token(constants.GRAPH_SCOPE)
+    except Exception as e:
+        logger.warning("Worker warm-up incomplete: %s", e)
+
+
+threading.Thread(target=_warmup, name="MyHttpTrigger-warmup", daemon=True).start()
+
+
 def main(req: func.HttpRequest) -> func.HttpResponse:
-    invocation_id = os.environ.get("InvocationID", None)
-    logging_prefix = f"[InvocationId: {invocation_id}]" if invocation_id else "[No InvocationId]"
-    logger.info(f"{logging_prefix} MyHttpTrigger_Function processed a request.")
+    # Rechazo inmediato de sondas/health-checks (GET, HEAD...) antes de cualquier otro trabajo.
+    if req.method != "POST":
+        return _json_response(_ERR_METHOD_NOT_ALLOWED, 405)
 
-    action_name = None
-    params_req = {}
+    request_id = req.headers.get("X-Request-ID") or f"{_WORKER_TAG}-{next(_REQ_COUNTER):x}"
+    _LOG_PREFIX.set(f"[InvocationId: {_INVOCATION_ID}]" if _INVOCATION_ID else f"[RequestId: {request_id}]")
+    logger.debug("MyHttpTrigger_Function processed a request.")
+
+    raw_body = req.get_body()
+    if not raw_body:
+        # Cuerpo vacío: se rechaza sin pasar por el parser ni por el manejo de excepciones.
+        logger.error("Empty request body.")
+        return _json_response(_ERR_INVALID_JSON, 400)
     try:
-        if req.method != "POST":
-            return func.HttpResponse(
-                json.dumps({"error": "MethodNotAllowed", "message": "Solo se permite el método POST."}),
-                status_code=405,
-                mimetype="application/json"
-            )
-        try:
-            req_body = req.get_json()
-        except ValueError:
-            logger.error(f"{logging_prefix} Invalid JSON received in request body.")
-            return func.HttpResponse(
-                json.dumps({"error": "InvalidJSON", "message": "El cuerpo de la solicitud no es un JSON válido."}),
-                status_code=400,
-                mimetype="application/json"
-            )
-        action_name = req_body.get('action')
-        params_req = req_body.get('params', {})
-        if not action_name:
-            logger.error(f"{logging_prefix} 'action' missing in request body.")
-            return func.HttpResponse(
-                json.dumps({"error": "MissingAction", "message": "El campo 'action' es requerido en el cuerpo JSON."}),
-                status_code=400,
-                mimetype="application/json"
-            )
-        logger.info(f"{logging_prefix} Request validated. Action: '{action_name}', Params keys: {list(params_req.keys())}")
+        req_body = orjson.loads(raw_body)
+    except ValueError:
+        logger.error("Invalid JSON received in request body.")
+        return _json_response(_ERR_INVALID_JSON, 400)
+    if not isinstance(req_body, dict):
+        logger.error("Request body is not a JSON object.")
+        return _json_response(_ERR_BODY_NOT_OBJECT, 400)
+    action_name = req_body.get('action')
+    params_req = req_body.get('params')
+    if params_req is None:
+        params_req = {}
+    if not action_name:
+        logger.error("'action' missing in request body.")
+        return _json_response(_ERR_MISSING_ACTION, 400)
+    if not isinstance(params_req, dict):
+        logger.error("'params' in request body is not a JSON object.")
+        return _json_response(_ERR_PARAMS_NOT_OBJECT, 400)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Request validated. Action: '%s', Params keys: %s", action_name, list(params_req.keys()))
+
+    # Las acciones desconocidas se rechazan antes de preparar credencial y cliente HTTP.
+    try:
+        action_function = _get_action_map().get(action_name) if isinstance(action_name, str) else None
     except Exception as e:
-        logger.exception(f"{logging_prefix} Unexpected error during request validation: {e}")
-        return func.HttpResponse(
-             json.dumps({"error": "BadRequest", "message": f"Error inesperado al procesar la solicitud: {str(e)}"}),
-             status_code=400,
-             mimetype="application/json"
-        )
+        logger.exception("Error loading ACTION_MAP: %s", e)
+        return _json_response(orjson.dumps({"error": "SetupError", "message": f"Error interno al cargar el mapa de acciones: {str(e)}"}), 500)
+    if not action_function:
+        logger.error("Action '%s' not found in ACTION_MAP.", action_name)
+        return _json_response(orjson.dumps({"error": "ActionNotFound", "message": f"La acción '{action_name}' no es válida."}), 400)
 
     try:
-        credential = DefaultAzureCredential()
-        # Es buena práctica verificar el token aquí si quieres un fallo rápido en caso de problemas de identidad.
-        try:
-            token_test = credential.get_token(*constants.GRAPH_API_DEFAULT_SCOPE)
-            logger.info(f"{logging_prefix} DefaultAzureCredential obtained successfully. Token for {constants.GRAPH_API_DEFAULT_SCOPE[0]} will expire at {token_test.expires_on}.")
-        except CredentialUnavailableError as cred_err:
-            logger.error(f"{logging_prefix} Credential unavailable: {cred_err}. Asegúrese de que la Identidad Administrada esté configurada y con permisos, o que haya iniciado sesión localmente (ej. az login).")
-            return func.HttpResponse(
-                  json.dumps({"error": "AuthenticationError", "message": f"No se pudieron obtener las credenciales de autenticación: {str(cred_err)}"}),
-                  status_code=500,
-                  mimetype="application/json"
-            )
-        except Exception as token_err:
-             logger.error(f"{logging_prefix} Error obtaining initial token: {token_err}. Verifique los permisos de la Identidad Administrada.")
-             return func.HttpResponse(
-                  json.dumps({"error": "AuthenticationError", "message": f"Error al obtener el token inicial: {str(token_err)}"}),
-                  status_code=500,
-                  mimetype="application/json"
-             )
-
-        auth_http_client = AuthenticatedHttpClient(credential)
-        logger.info(f"{logging_prefix} Authenticated HTTP client initialized.")
+        auth_http_client = _get_http_client()
     except Exception as e:
-        logger.exception(f"{logging_prefix} Error during authentication setup: {e}")
-        return func.HttpResponse(
-             json.dumps({"error": "SetupError", "message": f"Error interno durante la configuración de autenticación: {str(e)}"}),
-             status_code=500,
-             mimetype="application/json"
-        )
+        logger.exception("Error during authentication setup: %s", e)
+        return _json_response(orjson.dumps({"error": "SetupError", "message": f"Error interno durante la configuración de autenticación: {str(e)}"}), 500)
 
     try:
-        action_function = mapping_actions.ACTION_MAP.get(action_name)
-        if not action_function:
-            logger.error(f"{logging_prefix} Action '{action_name}' not found in ACTION_MAP.")
-            return func.HttpResponse(
-                json.dumps({"error": "ActionNotFound", "message": f"La acción '{action_name}' no es válida."}),
-                status_code=400,
-                mimetype="application/json"
-            )
-        logger.info(f"{logging_prefix} Executing action '{action_name}' with function {action_function.__name__} from module {action_function.__module__}")
+        logger.info("Executing action '%s' with function %s from module %s", action_name, action_function.__name__, action_function.__module__)
         result = action_function(auth_http_client, params_req)
 
-        if isinstance(result, dict) and result.get("error"):
-             logger.error(f"{logging_prefix} Action '{action_name}' failed with error: {result}")
-             status_code = result.get("http_status", 500)
-             if 200 <= status_code < 300:
-                  status_code = 500
-             return func.HttpResponse(
-                 json.dumps(result),
-                 status_code=status_code,
-                 mimetype="application/json"
-             )
+        if isinstance(result, dict):
+             # Contrato de las acciones: 'http_status' (int) indica el código HTTP de la respuesta;
+             # 'error' o status == "error" marcan un fallo aunque no traigan código.
+             # bool es subclase de int: 'http_status: true' no es un código válido.
+             status_code = result.get("http_status")
+             if not isinstance(status_code, int) or isinstance(status_code, bool) or not 100 <= status_code <= 599:
+                  status_code = 200
+             is_error = bool(result.get("error")) or result.get("status") == "error" or not 200 <= status_code < 300
+             if is_error and result.get("status") == "success":
+                  # Resultado esperado que la acción marca como éxito con un código no-2xx
+                  # (p.ej. 404 sin manager o sin foto de perfil): se devuelve tal cual, sin log de error.
+                  logger.info("Action '%s' completed with status %s.", action_name, status_code)
+             elif is_error:
+                  if 200 <= status_code < 300:
+                       status_code = 500
+                  logger.error("Action '%s' failed with error: %s", action_name, result)
+             else:
+                  # Varias acciones copian el status de Graph (204 en los DELETE), pero la respuesta
+                  # lleva siempre el dict como cuerpo JSON y un 204 no puede llevar cuerpo.
+                  if status_code == 204:
+                       status_code = 200
+                  logger.info("Action '%s' executed successfully.", action_name)
+             return _json_response(orjson.dumps(result, option=_RESULT_DUMPS_OPTION), status_code)
         elif isinstance(result, bytes):
-            logger.info(f"{logging_prefix} Action '{action_name}' executed successfully, returning binary data.")
-            mimetype_bin = "application/octet-stream"
-            if "photo" in action_name.lower() or action_name.endswith("_get_my_photo"):
-                mimetype_bin = "image/jpeg"
+            logger.info("Action '%s' executed successfully, returning binary data.", action_name)
             return func.HttpResponse(
                 result,
                 status_code=200,
-                mimetype=mimetype_bin
+                mimetype="image/jpeg" if action_name in _get_jpeg_actions() else "application/octet-stream"
             )
         else:
-             logger.info(f"{logging_prefix} Action '{action_name}' executed successfully.")
-             return func.HttpResponse(
-                 json.dumps(result),
-                 status_code=200,
-                 mimetype="application/json"
-             )
+             logger.info("Action '%s' executed successfully.", action_name)
+             return _json_response(orjson.dumps(result, option=_RESULT_DUMPS_OPTION), 200)
     except Exception as e:
-        logger.exception(f"{logging_prefix} Unexpected error during action execution for '{action_name}': {e}")
-        return func.HttpResponse(
-             json.dumps({"error": "ExecutionError", "message": f"Error inesperado al ejecutar la acción '{action_name}': {str(e)}"}),
-             status_code=500,
-             mimetype="application/json"
-        )
\ No newline at end of file
+        logger.exception("Unexpected error during action execution for '%s': %s", action_name, e)
+        return _json_response(orjson.dumps({"error": "ExecutionError", "message": f"Error inesperado al ejecutar la acción '{action_name}': {str(e)}"}), 500)
\ No newline at end of file
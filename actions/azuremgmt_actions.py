@@ -9,105 +9,29 @@ from shared.helpers.http_client import AuthenticatedHttpClient # Asumiendo que e
 logger = logging.getLogger(__name__)
 
 # --- Placeholder Functions ---
-
-def list_resource_groups(client: AuthenticatedHttpClient, params: dict) -> dict:
-    action_name = "azure_list_resource_groups"
-    logger.warning(f"Acción '{action_name}' del servicio '{__name__}' no implementada todavía.")
-    return {
-        "status": "not_implemented",
-        "message": f"Acción '{action_name}' no implementada todavía.",
-        "service_module": __name__,
-        "http_status": 501
-    }
-
-def list_resources_in_rg(client: AuthenticatedHttpClient, params: dict) -> dict:
-    action_name = "azure_list_resources_in_rg"
-    logger.warning(f"Acción '{action_name}' del servicio '{__name__}' no implementada todavía.")
-    return {
-        "status": "not_implemented",
-        "message": f"Acción '{action_name}' no implementada todavía.",
-        "service_module": __name__,
-        "http_status": 501
-    }
-
-def get_resource(client: AuthenticatedHttpClient, params: dict) -> dict:
-    action_name = "azure_get_resource"
-    logger.warning(f"Acción '{action_name}' del servicio '{__name__}' no implementada todavía.")
-    return {
-        "status": "not_implemented",
-        "message": f"Acción '{action_name}' no implementada todavía.",
-        "service_module": __name__,
-        "http_status": 501
-    }
-
-def create_deployment(client: AuthenticatedHttpClient, params: dict) -> dict:
-    action_name = "azure_create_deployment"
-    logger.warning(f"Acción '{action_name}' del servicio '{__name__}' no implementada todavía.")
-    return {
-        "status": "not_implemented",
-        "message": f"Acción '{action_name}' no implementada todavía.",
-        "service_module": __name__,
-        "http_status": 501
-    }
-
-def list_functions(client: AuthenticatedHttpClient, params: dict) -> dict:
-    action_name = "azure_list_functions"
-    logger.warning(f"Acción '{action_name}' del servicio '{__name__}' no implementada todavía.")
-    return {
-        "status": "not_implemented",
-        "message": f"Acción '{action_name}' no implementada todavía.",
-        "service_module": __name__,
-        "http_status": 501
-    }
-
-def get_function_status(client: AuthenticatedHttpClient, params: dict) -> dict:
-    action_name = "azure_get_function_status"
-    logger.warning(f"Acción '{action_name}' del servicio '{__name__}' no implementada todavía.")
-    return {
-        "status": "not_implemented",
-        "message": f"Acción '{action_name}' no implementada todavía.",
-        "service_module": __name__,
-        "http_status": 501
-    }
-
-def restart_function_app(client: AuthenticatedHttpClient, params: dict) -> dict:
-    action_name = "azure_restart_function_app"
-    logger.warning(f"Acción '{action_name}' del servicio '{__name__}' no implementada todavía.")
-    return {
-        "status": "not_implemented",
-        "message": f"Acción '{action_name}' no implementada todavía.",
-        "service_module": __name__,
-        "http_status": 501
-    }
-
-def list_logic_apps(client: AuthenticatedHttpClient, params: dict) -> dict:
-    action_name = "azure_list_logic_apps"
-    logger.warning(f"Acción '{action_name}' del servicio '{__name__}' no implementada todavía.")
-    return {
-        "status": "not_implemented",
-        "message": f"Acción '{action_name}' no implementada todavía.",
-        "service_module": __name__,
-        "http_status": 501
-    }
-
-def trigger_logic_app(client: AuthenticatedHttpClient, params: dict) -> dict:
-    action_name = "azure_trigger_logic_app"
-    logger.warning(f"Acción '{action_name}' del servicio '{__name__}' no implementada todavía.")
-    return {
-        "status": "not_implemented",
-        "message": f"Acción '{action_name}' no implementada todavía.",
-        "service_module": __name__,
-        "http_status": 501
-    }
-
-def get_logic_app_run_history(client: AuthenticatedHttpClient, params: dict) -> dict:
-    action_name = "azure_get_logic_app_run_history"
-    logger.warning(f"Acción '{action_name}' del servicio '{__name__}' no implementada todavía.")
-    return {
-        "status": "not_implemented",
-        "message": f"Acción '{action_name}' no implementada todavía.",
-        "service_module": __name__,
-        "http_status": 501
-    }
+# Todas comparten la misma respuesta 501; se generan con una fábrica en lugar de repetir el cuerpo.
+
+def _placeholder(function_name: str, action_name: str):
+    def placeholder(client: AuthenticatedHttpClient, params: dict) -> dict:
+        logger.warning("Acción '%s' del servicio '%s' no implementada todavía.", action_name, __name__)
+        return {
+            "status": "not_implemented",
+            "message": f"Acción '{action_name}' no implementada todavía.",
+            "service_module": __name__,
+            "http_status": 501
+        }
+    placeholder.__name__ = placeholder.__qualname__ = function_name
+    return placeholder
+
+list_resource_groups = _placeholder("list_resource_groups", "azure_list_resource_groups")
+list_resources_in_rg = _placeholder("list_resources_in_rg", "azure_list_resources_in_rg")
+get_resource = _placeholder("get_resource", "azure_get_resource")
+create_deployment = _placeholder("create_deployment", "azure_create_deployment")
+list_functions = _placeholder("list_functions", "azure_list_functions")
+get_function_status = _placeholder("get_function_status", "azure_get_function_status")
+restart_function_app = _placeholder("restart_function_app", "azure_restart_function_app")
+list_logic_apps = _placeholder("list_logic_apps", "azure_list_logic_apps")
+trigger_logic_app = _placeholder("trigger_logic_app", "azure_trigger_logic_app")
+get_logic_app_run_history = _placeholder("get_logic_app_run_history", "azure_get_logic_app_run_history")
 
 # ... (añadir más placeholders según sea necesario para Azure Mgmt)
\ No newline at end of file
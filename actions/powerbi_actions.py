@@ -22,6 +22,12 @@ PBI_API_DEFAULT_SCOPE = ["https://analysis.windows.net/powerbi/api/.default"]
 # Timeout para llamadas a Power BI API (puede ser más largo que el default de Graph)
 PBI_API_CALL_TIMEOUT = max(constants.DEFAULT_API_TIMEOUT, 120) # Ej. 120 segundos
 
+# Credenciales de aplicación para Power BI leídas una sola vez al cargar el módulo
+# (no cambian durante la vida del worker); los parámetros de la acción pueden anularlas.
+PBI_TENANT_ID = os.environ.get("PBI_TENANT_ID", os.environ.get("TENANT_ID"))
+PBI_CLIENT_ID = os.environ.get("PBI_CLIENT_ID")
+PBI_CLIENT_SECRET = os.environ.get("PBI_CLIENT_SECRET")
+
 # --- Helper de Autenticación (Específico para Power BI API con Client Credentials) ---
 _pbi_credential_instance: Optional[ClientSecretCredential] = None
 _pbi_last_token_info: Optional[Dict[str, Any]] = None # Cache simple para el token y su expiración
@@ -41,9 +47,9 @@ def _get_powerbi_api_token(parametros_auth_override: Optional[Dict[str, Any]] =
     # `parametros_auth_override` permite pasar credenciales dinámicamente (ej. para multi-tenant scenarios no comunes aquí)
     auth_params = parametros_auth_override or {}
     
-    tenant_id = auth_params.get("pbi_tenant_id", os.environ.get("PBI_TENANT_ID", os.environ.get("TENANT_ID")))
-    client_id = auth_params.get("pbi_client_id", os.environ.get("PBI_CLIENT_ID"))
-    client_secret = auth_params.get("pbi_client_secret", os.environ.get("PBI_CLIENT_SECRET"))
+    tenant_id = auth_params.get("pbi_tenant_id", PBI_TENANT_ID)
+    client_id = auth_params.get("pbi_client_id", PBI_CLIENT_ID)
+    client_secret = auth_params.get("pbi_client_secret", PBI_CLIENT_SECRET)
 
     if not all([tenant_id, client_id, client_secret]):
         missing = [name for name, var in [("PBI_TENANT_ID/TENANT_ID", tenant_id), 
@@ -38,7 +38,7 @@ def _log_scope_fallback_warnings_sp(): # Renombrado para evitar colisión con ot
     }
     for name, actual_scope_val_list in scopes_to_check.items():
         if actual_scope_val_list and constants.GRAPH_SCOPE and \
-           isinstance(actual_scope_val_list, list) and isinstance(constants.GRAPH_SCOPE, list) and \
+           isinstance(actual_scope_val_list, (list, tuple)) and isinstance(constants.GRAPH_SCOPE, (list, tuple)) and \
            actual_scope_val_list[0] == constants.GRAPH_SCOPE[0] and name != "GRAPH_SCOPE": # Evitar warning para GRAPH_SCOPE mismo
             logger.warning(f"SharePoint: Usando GRAPH_SCOPE general para una operación que podría beneficiarse de '{name}'. Considere definir '{name}' en constants.py.")
 _log_scope_fallback_warnings_sp()
@@ -11,16 +11,17 @@ AZURE_MGMT_API_BASE_URL = os.environ.get("AZURE_MGMT_ENDPOINT", "https://managem
 
 
 # --- Scopes por Servicio ---
-GRAPH_SCOPE = [os.environ.get("GRAPH_SCOPE_DEFAULT", "https://graph.microsoft.com/.default")]
+# Tuplas (inmutables): AuthenticatedHttpClient las usa directamente como clave de su cache de tokens.
+GRAPH_SCOPE = (os.environ.get("GRAPH_SCOPE_DEFAULT", "https://graph.microsoft.com/.default"),)
 # Opcional: Si alguna vez usas la versión beta de Graph
-GRAPH_BETA_SCOPE = [os.environ.get("GRAPH_BETA_SCOPE_DEFAULT", "https://graph.microsoft.com/.default")]
+GRAPH_BETA_SCOPE = (os.environ.get("GRAPH_BETA_SCOPE_DEFAULT", "https://graph.microsoft.com/.default"),)
 
-AZURE_MGMT_SCOPE = [os.environ.get("AZURE_MGMT_SCOPE_DEFAULT", "https://management.azure.com/.default")]
-POWER_BI_SCOPE = [os.environ.get("POWER_BI_SCOPE_DEFAULT", "https://analysis.windows.net/powerbi/api/.default")]
+AZURE_MGMT_SCOPE = (os.environ.get("AZURE_MGMT_SCOPE_DEFAULT", "https://management.azure.com/.default"),)
+POWER_BI_SCOPE = (os.environ.get("POWER_BI_SCOPE_DEFAULT", "https://analysis.windows.net/powerbi/api/.default"),)
 
 # Scope para Azure OpenAI
 AZURE_OPENAI_RESOURCE_ENDPOINT = os.environ.get("AZURE_OPENAI_RESOURCE_ENDPOINT")
-OPENAI_SCOPE = [f"{AZURE_OPENAI_RESOURCE_ENDPOINT}/.default"] if AZURE_OPENAI_RESOURCE_ENDPOINT else []
+OPENAI_SCOPE = (f"{AZURE_OPENAI_RESOURCE_ENDPOINT}/.default",) if AZURE_OPENAI_RESOURCE_ENDPOINT else ()
 
 
 # --- Configuración Específica de Servicios ---
@@ -41,6 +42,8 @@ AZURE_OPENAI_API_VERSION = os.environ.get("AZURE_OPENAI_API_VERSION", "2024-02-1
 
 # --- Configuración General de API Calls ---
 DEFAULT_API_TIMEOUT = int(os.environ.get("DEFAULT_API_TIMEOUT", "60"))  # Timeout en segundos
+HTTP_POOL_MAXSIZE = int(os.environ.get("HTTP_POOL_MAXSIZE", "50"))  # Conexiones keep-alive por host en la sesión compartida
+HTTP_MAX_RETRIES = int(os.environ.get("HTTP_MAX_RETRIES", "3"))  # Reintentos ante 429/5xx transitorios (0 = desactivado)
 
 
 # --- Validaciones (Opcional pero Recomendado para producción) ---
@@ -1,36 +1,103 @@
 # EliteDynamicsPro_Local/shared/helpers/http_client.py
 import logging
+import random
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from azure.identity import DefaultAzureCredential, CredentialUnavailableError, ClientAuthenticationError
-from typing import List, Optional, Any, Dict
+from azure.core.credentials import AccessToken
+from typing import Sequence, Optional, Any, Dict, Tuple
 
 # Importación directa de constants (desde la carpeta 'shared' en la raíz)
 from shared import constants # 'constants.py' está en 'shared/'
 
 logger = logging.getLogger(__name__)
 
+# Margen (segundos) antes de la expiración en el que un token cacheado deja de reutilizarse.
+TOKEN_REFRESH_MARGIN_SECONDS = 300
+
+# Tope (segundos) de cada espera entre reintentos, aunque Retry-After pida más: el front-end de
+# las funciones HTTP corta hacia los 230 s y el cliente recibiría un 502 en lugar del error JSON.
+THROTTLE_MAX_DELAY_SECONDS = 30.0
+
+# POST/PATCH no los reintenta el adapter (no son idempotentes). Con 429/503 Graph indica que la
+# solicitud no se procesó por throttling, así que se repiten aquí respetando Retry-After.
+THROTTLE_RETRY_METHODS = frozenset(("POST", "PATCH"))
+THROTTLE_RETRY_STATUS = frozenset((429, 503))
+
+
+class _CappedRetry(Retry):
+    """Retry de urllib3 que respeta Retry-After pero sin superar THROTTLE_MAX_DELAY_SECONDS."""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, THROTTLE_MAX_DELAY_SECONDS)
+
+
 class AuthenticatedHttpClient:
     def __init__(self, credential: DefaultAzureCredential, default_timeout: int = constants.DEFAULT_API_TIMEOUT):
         if not isinstance(credential, DefaultAzureCredential):
             raise TypeError("Se requiere una instancia de DefaultAzureCredential.")
         self.credential = credential
         self.session = requests.Session()
+        # El cliente se comparte entre todas las invocaciones del worker: el pool por defecto de
+        # requests (10 conexiones por host) se queda corto con peticiones concurrentes a Graph y
+        # las conexiones sobrantes se descartan, pagando de nuevo TCP+TLS en la siguiente llamada.
+        # Reintentos con backoff exponencial ante throttling (429) y 5xx transitorios de Graph/ARM,
+        # respetando Retry-After (con tope). Solo métodos idempotentes (por defecto de urllib3: GET,
+        # PUT, DELETE...); raise_on_status=False devuelve la última respuesta a raise_for_status().
+        # read=False: un timeout de lectura no se reintenta (como el default de requests), o una
+        # llamada colgada costaría varias veces DEFAULT_API_TIMEOUT.
+        retries = _CappedRetry(
+            total=constants.HTTP_MAX_RETRIES,
+            read=False,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_maxsize=constants.HTTP_POOL_MAXSIZE, max_retries=retries)
+        self.session.mount("https://", adapter)
         self.default_timeout = default_timeout if default_timeout is not None else constants.DEFAULT_API_TIMEOUT
+        # Cache de tokens por scope: evita recorrer la cadena de DefaultAzureCredential en cada llamada.
+        self._token_cache: Dict[Tuple[str, ...], Tuple[AccessToken, str]] = {}
+        # Un lock por scope: los hilos que encuentran el mismo token caducado esperan a una sola
+        # renovación, y renovar el token de Graph no bloquea a quien necesita el de otro servicio.
+        self._token_locks: Dict[Tuple[str, ...], threading.Lock] = {}
         self.session.headers.update({
             'User-Agent': f'{constants.APP_NAME}/{constants.APP_VERSION}', 
             'Accept': 'application/json'
         })
         logger.info("AuthenticatedHttpClient inicializado con DefaultAzureCredential.")
 
-    def _get_access_token(self, scope: List[str]) -> Optional[str]:
+    def _get_token_entry(self, scope: Sequence[str]) -> Optional[Tuple[AccessToken, str]]:
+        """Devuelve (AccessToken, valor de cabecera 'Authorization') para el scope, usando la cache."""
         if not scope:
             logger.error("Se requiere un scope para obtener el token de acceso.")
             return None
+        # Los scopes de constants ya son tuplas; las listas (scopes ad hoc) se convierten.
+        cache_key = scope if isinstance(scope, tuple) else tuple(scope)
+        # Camino rápido sin lock: leer del dict es atómico bajo el GIL.
+        cached = self._token_cache.get(cache_key)
+        if cached is not None and cached[0].expires_on - time.time() > TOKEN_REFRESH_MARGIN_SECONDS:
+            return cached
         try:
-            logger.debug(f"Solicitando token para scope: {scope}")
-            token_result = self.credential.get_token(*scope)
-            logger.debug(f"Token obtenido exitosamente para scope: {scope}. Expiración: {token_result.expires_on}")
-            return token_result.token
+            # dict.setdefault es atómico bajo el GIL: todos los hilos obtienen el mismo lock.
+            with self._token_locks.setdefault(cache_key, threading.Lock()):
+                # Re-comprobar: otro hilo puede haber renovado el token mientras se esperaba el lock.
+                cached = self._token_cache.get(cache_key)
+                if cached is not None and cached[0].expires_on - time.time() > TOKEN_REFRESH_MARGIN_SECONDS:
+                    return cached
+                logger.debug("Solicitando token para scope: %s", scope)
+                token_result = self.credential.get_token(*scope)
+                # La cabecera se construye una vez por token y se reutiliza mientras el token sea válido.
+                cached = (token_result, f'Bearer {token_result.token}')
+                self._token_cache[cache_key] = cached
+            logger.debug("Token obtenido exitosamente para scope: %s. Expiración: %s", scope, token_result.expires_on)
+            return cached
         except CredentialUnavailableError as e:
             logger.error(f"Error de credencial al obtener token para {scope}: {e}.")
             return None
@@ -41,23 +108,55 @@ class AuthenticatedHttpClient:
             logger.exception(f"Error inesperado al obtener token para {scope}: {e}")
             return None
 
-    def request(self, method: str, url: str, scope: List[str], **kwargs: Any) -> requests.Response:
-        access_token = self._get_access_token(scope)
-        if not access_token:
+    def _get_access_token(self, scope: Sequence[str]) -> Optional[str]:
+        token_entry = self._get_token_entry(scope)
+        return token_entry[0].token if token_entry else None
+
+    def prefetch_token(self, scope: Sequence[str]) -> bool:
+        """Obtiene y cachea el token del scope por adelantado (p.ej. al arrancar el worker). Devuelve si se obtuvo."""
+        return self._get_token_entry(scope) is not None
+
+    def request(self, method: str, url: str, scope: Sequence[str], **kwargs: Any) -> requests.Response:
+        token_entry = self._get_token_entry(scope)
+        if not token_entry:
             raise ValueError(f"No se pudo obtener el token de acceso para el scope {scope}.")
         request_headers = kwargs.pop('headers', {}).copy()
-        request_headers['Authorization'] = f'Bearer {access_token}'
+        request_headers['Authorization'] = token_entry[1]
         if 'json' in kwargs or 'data' in kwargs:
              if 'Content-Type' not in request_headers:
                   request_headers['Content-Type'] = 'application/json'
         timeout = kwargs.pop('timeout', self.default_timeout)
-        logger.debug(f"Realizando solicitud {method} a {url} con scope {scope}")
+        logger.debug("Realizando solicitud %s a %s con scope %s", method, url, scope)
+        # Solo se puede repetir un cuerpo ya materializado (json, bytes, str), no un stream.
+        retry_throttled = method.upper() in THROTTLE_RETRY_METHODS and isinstance(kwargs.get('data'), (type(None), bytes, str, dict))
         try:
-            response = self.session.request(
-                method=method, url=url, headers=request_headers, timeout=timeout, **kwargs
-            )
+            attempt = 0
+            # Presupuesto total de los reintentos por throttling: no se duerme si la espera
+            # terminaría después de 2 * timeout (el de esta llamada, que puede ser mayor que el
+            # por defecto en subidas o llamadas de management) desde el inicio de la solicitud.
+            if isinstance(timeout, (int, float)):
+                attempt_timeout = timeout
+            elif isinstance(timeout, tuple):
+                attempt_timeout = sum(t for t in timeout if t is not None)  # (connect, read)
+            else:
+                attempt_timeout = self.default_timeout
+            deadline = time.monotonic() + 2 * attempt_timeout
+            while True:
+                response = self.session.request(
+                    method=method, url=url, headers=request_headers, timeout=timeout, **kwargs
+                )
+                if not (retry_throttled and response.status_code in THROTTLE_RETRY_STATUS and attempt < constants.HTTP_MAX_RETRIES):
+                    break
+                delay = self._throttle_delay(response, attempt)
+                if time.monotonic() + delay > deadline:
+                    logger.warning("Throttling (%s) en %s %s; sin presupuesto de tiempo para reintentar.", response.status_code, method, url)
+                    break
+                logger.warning("Throttling (%s) en %s %s; reintento %d en %.1fs", response.status_code, method, url, attempt + 1, delay)
+                response.close()
+                time.sleep(delay)
+                attempt += 1
             response.raise_for_status() 
-            logger.debug(f"Solicitud {method} a {url} exitosa (Status: {response.status_code})")
+            logger.debug("Solicitud %s a %s exitosa (Status: %s)", method, url, response.status_code)
             return response
         except requests.exceptions.HTTPError as http_err:
             logger.error(f"Error HTTP en {method} {url}: {http_err.response.status_code} - {http_err.response.text[:500]}...")
@@ -69,10 +168,18 @@ class AuthenticatedHttpClient:
              logger.exception(f"Error inesperado durante la solicitud {method} a {url}: {e}")
              raise e 
 
-    def get(self, url: str, scope: List[str], **kwargs: Any) -> requests.Response:
+    @staticmethod
+    def _throttle_delay(response: requests.Response, attempt: int) -> float:
+        """Espera antes de reintentar: Retry-After (segundos) si viene, si no backoff exponencial con jitter."""
+        retry_after = response.headers.get('Retry-After')
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), THROTTLE_MAX_DELAY_SECONDS)
+        return min(0.5 * (2 ** attempt) + random.uniform(0, 0.1), THROTTLE_MAX_DELAY_SECONDS)
+
+    def get(self, url: str, scope: Sequence[str], **kwargs: Any) -> requests.Response:
         return self.request('GET', url, scope, **kwargs)
 
-    def post(self, url: str, scope: List[str], **kwargs: Any) -> requests.Response:
+    def post(self, url: str, scope: Sequence[str], **kwargs: Any) -> requests.Response:
         if 'json_data' in kwargs and 'json' not in kwargs : 
             kwargs['json'] = kwargs.pop('json_data')
         if 'json' in kwargs and 'headers' not in kwargs:
@@ -81,7 +188,7 @@ class AuthenticatedHttpClient:
              kwargs.setdefault('headers', {})['Content-Type'] = 'application/json'
         return self.request('POST', url, scope, **kwargs)
 
-    def put(self, url: str, scope: List[str], **kwargs: Any) -> requests.Response:
+    def put(self, url: str, scope: Sequence[str], **kwargs: Any) -> requests.Response:
         if 'json_data' in kwargs and 'json' not in kwargs : 
             kwargs['json'] = kwargs.pop('json_data')
         if 'json' in kwargs and 'headers' not in kwargs:
@@ -90,10 +197,10 @@ class AuthenticatedHttpClient:
              kwargs.setdefault('headers', {})['Content-Type'] = 'application/json'
         return self.request('PUT', url, scope, **kwargs)
 
-    def delete(self, url: str, scope: List[str], **kwargs: Any) -> requests.Response:
+    def delete(self, url: str, scope: Sequence[str], **kwargs: Any) -> requests.Response:
         return self.request('DELETE', url, scope, **kwargs)
 
-    def patch(self, url: str, scope: List[str], **kwargs: Any) -> requests.Response:
+    def patch(self, url: str, scope: Sequence[str], **kwargs: Any) -> requests.Response:
         if 'json_data' in kwargs and 'json' not in kwargs : 
             kwargs['json'] = kwargs.pop('json_data')
         if 'json' in kwargs and 'headers' not in kwargs: